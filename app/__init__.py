@@ -1,5 +1,9 @@
 """This directory contains both the front-end and back-end for the quotes website."""
 
+import time
 from pathlib import Path
 
+IMPORTED_AT = time.perf_counter()
+"""The `time.perf_counter()` value when the app package was first imported, for timing the app's startup."""
+
 TEMPLATES_DIR = Path(__file__).parent / "templates"
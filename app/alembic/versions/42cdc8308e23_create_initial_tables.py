@@ -0,0 +1,62 @@
+"""Create the initial tables.
+
+Revision ID: 42cdc8308e23
+Revises:
+Create Date: 2026-10-18 21:21:04.980484-04:00
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+import sqlmodel
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "42cdc8308e23"
+down_revision: str | Sequence[str] | None = None
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "author",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("raw_name", sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(op.f("ix_author_raw_name"), "author", ["raw_name"], unique=True)
+    op.create_table(
+        "quote",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("before_context", sqlmodel.sql.sqltypes.AutoString(), nullable=True),
+        sa.Column("after_context", sqlmodel.sql.sqltypes.AutoString(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_table(
+        "singlequote",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("text", sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+        sa.Column("author_id", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["author_id"], ["author.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_table(
+        "quotelink",
+        sa.Column("single_quote_id", sa.Integer(), nullable=False),
+        sa.Column("quote_id", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["quote_id"], ["quote.id"]),
+        sa.ForeignKeyConstraint(["single_quote_id"], ["singlequote.id"]),
+        sa.PrimaryKeyConstraint("single_quote_id", "quote_id"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("quotelink")
+    op.drop_table("singlequote")
+    op.drop_table("quote")
+    op.drop_index(op.f("ix_author_raw_name"), table_name="author")
+    op.drop_table("author")
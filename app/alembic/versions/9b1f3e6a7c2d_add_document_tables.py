@@ -0,0 +1,46 @@
+"""Add the pre-serialized author and quote document tables.
+
+The documents of any existing authors and quotes are backfilled by the app on startup, see
+`app.database.backfill_documents`.
+
+Revision ID: 9b1f3e6a7c2d
+Revises: 42cdc8308e23
+Create Date: 2026-10-18 21:24:37.512903-04:00
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+import sqlmodel
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "9b1f3e6a7c2d"
+down_revision: str | Sequence[str] | None = "42cdc8308e23"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "authordocument",
+        sa.Column("author_id", sa.Integer(), nullable=False),
+        sa.Column("document", sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+        sa.ForeignKeyConstraint(["author_id"], ["author.id"]),
+        sa.PrimaryKeyConstraint("author_id"),
+    )
+    op.create_table(
+        "quotedocument",
+        sa.Column("quote_id", sa.Integer(), nullable=False),
+        sa.Column("document", sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+        sa.ForeignKeyConstraint(["quote_id"], ["quote.id"]),
+        sa.PrimaryKeyConstraint("quote_id"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("quotedocument")
+    op.drop_table("authordocument")
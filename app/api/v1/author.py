@@ -1,30 +1,29 @@
 """Defines endpoints related to interacting with the `Author` object/table."""
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Response
 from sqlmodel import func, select
 
-from app.database import Author, Quote, SessionDep
+from app.database import Author, AuthorPublic, Quote, SessionDep, get_author_document
 
 author_router = APIRouter()
 
 
 @author_router.put("/author", response_model=Author)
 def create_author(author: Author, session: SessionDep) -> Author:
-    """Creates an `Author` in the database."""
+    """Creates an `Author` in the database, along with its pre-serialized `AuthorDocument` (see `app.database`)."""
     session.add(author)
     session.commit()
     session.refresh(author)
     return author
 
 
-@author_router.get("/author/{author_id}", response_model=Author)
-def get_author_by_id(author_id: int, session: SessionDep) -> Author:
-    """Gets the `Author` from the database with the given ID."""
-    statement = select(Author).where(Author.id == author_id)
-    author = session.exec(statement).one_or_none()
-    if not author:
+@author_router.get("/author/{author_id}", response_model=AuthorPublic)
+def get_author_by_id(author_id: int, session: SessionDep) -> Response:
+    """Gets the pre-serialized `Author` from the database with the given ID."""
+    author_document = get_author_document(author_id, session)
+    if not author_document:
         raise HTTPException(status_code=404, detail=f"Author with id={author_id} not found.")
-    return author
+    return Response(content=author_document, media_type="application/json")
 
 
 @author_router.get("/author/{author_id}/random", response_model=Quote)
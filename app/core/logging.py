@@ -1,10 +1,130 @@
-"""Configures the logging for the API."""
+"""Configures the logging for the API.
 
+Records are never written to a stream on the calling thread. Instead, the root logger hands them to a `QueueHandler`,
+and a `QueueListener` running on a background thread writes them to stderr. This keeps stream I/O out of the request
+path; `shutdown_logging` drains the queue before the app exits.
+"""
+
+import copy
+import json
 import logging
+import random
+from contextvars import ContextVar
+from logging.handlers import QueueHandler, QueueListener
+from queue import SimpleQueue
 
 from .settings import settings
 
+LOG_FORMAT = "%(asctime)s %(levelname)s [%(name)s] %(message)s"
+ACCESS_LOGGER_NAME = "app.access"
+
+_EXCEPTION_FORMATTER = logging.Formatter()
+
+request_id_var: ContextVar[str | None] = ContextVar("request_id", default=None)
+"""The ID of the request currently being handled, attached to every log record as `record.request_id`."""
+
+
+class RequestIdFilter(logging.Filter):
+    """Attaches the current request's ID to each log record, as read from `request_id_var`.
+
+    This must run on the `QueueHandler`, since the context variable is only set on the thread emitting the record.
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:  # noqa: D102
+        record.request_id = request_id_var.get()
+        return True
+
+
+class SamplingFilter(logging.Filter):
+    """Keeps only a random `rate` fraction of log records, where `rate` is between 0 and 1."""
+
+    def __init__(self, rate: float) -> None:  # noqa: D107
+        super().__init__()
+        self.rate = rate
+
+    def filter(self, record: logging.LogRecord) -> bool:  # noqa: ARG002, D102
+        return self.rate >= 1 or random.random() < self.rate
+
+
+class JsonFormatter(logging.Formatter):
+    """Formats each log record as a single-line JSON document, including its request ID and latency when present."""
+
+    def format(self, record: logging.LogRecord) -> str:  # noqa: D102
+        document = {
+            "timestamp": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "request_id": getattr(record, "request_id", None),
+        }
+        if (latency_ms := getattr(record, "latency_ms", None)) is not None:
+            document["latency_ms"] = latency_ms
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            document["exc_info"] = record.exc_text
+        if record.stack_info:
+            document["stack_info"] = self.formatStack(record.stack_info)
+        return json.dumps(document)
+
+
+class StructuredQueueHandler(QueueHandler):
+    """A `QueueHandler` that keeps a record's exception as a separate field, rather than merging it into the message.
+
+    The base `QueueHandler.prepare` formats the traceback into `record.msg` and clears `record.exc_info`, which would
+    leave nothing for `JsonFormatter` to put into its own field. Here, the traceback is formatted into `record.exc_text`
+    instead, which every `logging.Formatter` already knows to render after the message.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:  # noqa: D102
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        if record.exc_info and not record.exc_text:
+            record.exc_text = _EXCEPTION_FORMATTER.formatException(record.exc_info)
+        # the traceback holds the stack frames alive, so it mustn't be queued
+        record.exc_info = None
+        return record
+
+
+def _get_queue_handler() -> QueueHandler | None:
+    """Returns the `QueueHandler` installed on the root logger by `setup_logging`, if any."""
+    return next((handler for handler in logging.getLogger().handlers if isinstance(handler, QueueHandler)), None)
+
 
 def setup_logging() -> None:
-    """Configures the logging for the API."""
-    logging.basicConfig(level=settings.logging_level.value, format="%(asctime)s %(levelname)s [%(name)s] %(message)s")
+    """Configures the logging for the API, starting the background `QueueListener` if it isn't already running."""
+    if _get_queue_handler() is not None:
+        return
+
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(JsonFormatter() if settings.log_json else logging.Formatter(LOG_FORMAT))
+
+    log_queue = SimpleQueue()
+    queue_handler = StructuredQueueHandler(log_queue)
+    queue_handler.addFilter(RequestIdFilter())
+    queue_handler.listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+
+    root_logger = logging.getLogger()
+    root_logger.setLevel(settings.logging_level.value)
+    root_logger.addHandler(queue_handler)
+
+    logging.getLogger(ACCESS_LOGGER_NAME).addFilter(SamplingFilter(settings.access_log_sample_rate))
+
+    queue_handler.listener.start()
+
+
+def shutdown_logging() -> None:
+    """Flushes any queued log records, stops the background `QueueListener` and undoes `setup_logging`."""
+    queue_handler = _get_queue_handler()
+    if queue_handler is None:
+        return
+
+    queue_handler.listener.stop()
+    logging.getLogger().removeHandler(queue_handler)
+
+    access_logger = logging.getLogger(ACCESS_LOGGER_NAME)
+    for log_filter in list(access_logger.filters):
+        if isinstance(log_filter, SamplingFilter):
+            access_logger.removeFilter(log_filter)
@@ -41,6 +41,15 @@ class DBType(Enum):
     POSTGRES = "postgres"
 
 
+class SchemaStartupMode(Enum):
+    """An Enum class for how the database schema is handled when the app starts up."""
+
+    CREATE_ALL = "create_all"
+    """Creates any missing tables with `SQLModel.metadata.create_all`. Useful for local development."""
+    CHECK_REVISION = "check_revision"
+    """Only checks that the database is at the latest alembic revision, as the schema is managed by alembic."""
+
+
 class SettingNotFoundError(Exception):
     """Raised if a given setting can't be found in the environment."""
 
@@ -108,12 +117,17 @@ class Settings(BaseSettings):
     app_name: str = APP_NAME
     session_id: UUID = Field(default_factory=uuid4)
     logging_level: LogLevel = Field(default=LogLevel.DEBUG if DEBUG else LogLevel.INFO)
+    log_json: bool = Field(default=False)
+    access_log_sample_rate: float = Field(default=1.0, ge=0.0, le=1.0)
     db_type: DBType = Field(default=DBType.SQLITE)
     db_name: str = Field(default_factory=lambda: get_from_secret_or_env("db_name", str))
     db_user: str | None = Field(default_factory=lambda: get_from_secret_or_env_or_none("db_user", str))
     db_password: str | None = Field(default_factory=lambda: get_from_secret_or_env_or_none("db_password", str))
     db_port: int | None = Field(default=5432)
     db_hostname: str | None = Field(default="quotesboard-postgres")
+    schema_startup_mode: SchemaStartupMode = Field(default=SchemaStartupMode.CREATE_ALL)
+    template_cache_dir: Path | None = Field(default=None)
+    startup_target_ms: float | None = Field(default=None)
 
     @property
     def db_url(self) -> str:
@@ -1,11 +1,20 @@
 """Defines the database models/tables and contains functionality related to the R/W on these within the API."""
 
 from collections.abc import Generator
-from typing import Annotated
+from pathlib import Path
+from typing import TYPE_CHECKING, Annotated
 
 from fastapi import Depends
 from pydantic import computed_field
-from sqlmodel import Field, Relationship, Session, SQLModel, create_engine
+from sqlalchemy import event
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import UOWTransaction
+from sqlmodel import Field, Relationship, Session, SQLModel, col, create_engine, select
+
+if TYPE_CHECKING:
+    from alembic.config import Config
+
+PROJECT_DIR = Path(__file__).parent.parent
 
 
 class Author(SQLModel, table=True):
@@ -92,6 +101,189 @@ class Quote(SQLModel, table=True):
     after_context: str | None = Field(description="The context that for the quote, often as a punchline.")
 
 
+class AuthorPublic(SQLModel):
+    """The shape of an `Author` as it's served by the API, including its computed display names."""
+
+    id: int
+    raw_name: str
+    first_name: str
+    last_name: str
+    name: str
+
+
+class SingleQuotePublic(SQLModel):
+    """The shape of a `SingleQuote` as it's served within a `QuotePublic`, resolved with its `Author`."""
+
+    id: int
+    text: str
+    author_id: int
+    author: AuthorPublic
+
+
+class QuotePublic(SQLModel):
+    """The shape of a `Quote` as it's served by the API, fully resolved with its `SingleQuote`s and their `Author`s."""
+
+    id: int
+    before_context: str | None = None
+    after_context: str | None = None
+    single_quotes: list[SingleQuotePublic]
+
+
+class AuthorDocument(SQLModel, table=True):
+    """Stores the pre-serialized `AuthorPublic` JSON document of an `Author`.
+
+    This is written alongside the `Author` itself, so read endpoints can return it with a single primary-key lookup.
+    """
+
+    author_id: int = Field(foreign_key="author.id", primary_key=True)
+    document: str
+
+
+class QuoteDocument(SQLModel, table=True):
+    """Stores the pre-serialized `QuotePublic` JSON document of a `Quote`.
+
+    This is written alongside the `Quote` itself, so read endpoints can return it with a single primary-key lookup
+    rather than hydrating the `quote`, `quotelink`, `singlequote` and `author` tables on every request.
+    """
+
+    quote_id: int = Field(foreign_key="quote.id", primary_key=True)
+    document: str
+
+
+def author_public(author: Author) -> AuthorPublic:
+    """Converts an `Author` into its `AuthorPublic` form, including the computed display names."""
+    return AuthorPublic.model_validate(author.model_dump())
+
+
+def quote_public(quote: Quote) -> QuotePublic:
+    """Converts a `Quote` into its `QuotePublic` form, resolving each of its `SingleQuote`s and their `Author`."""
+    return QuotePublic(
+        **quote.model_dump(),
+        single_quotes=[
+            SingleQuotePublic(**single_quote.model_dump(), author=author_public(single_quote.author))
+            for single_quote in quote.single_quotes
+        ],
+    )
+
+
+def write_author_document(author: Author, session: Session) -> AuthorDocument:
+    """Writes (or overwrites) the `AuthorDocument` for the given (flushed) `Author` in the session's transaction."""
+    return session.merge(AuthorDocument(author_id=author.id, document=author_public(author).model_dump_json()))
+
+
+def write_quote_document(quote: Quote, session: Session) -> QuoteDocument:
+    """Writes (or overwrites) the `QuoteDocument` for the given (flushed) `Quote` in the session's transaction."""
+    return session.merge(QuoteDocument(quote_id=quote.id, document=quote_public(quote).model_dump_json()))
+
+
+_STALE_AUTHOR_IDS = "stale_author_ids"
+_STALE_QUOTE_IDS = "stale_quote_ids"
+_STALE_SINGLE_QUOTE_IDS = "stale_single_quote_ids"
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_stale_documents(session: Session, flush_context: UOWTransaction) -> None:  # noqa: ARG001
+    """Records which documents are made stale by the objects that were just flushed, in `session.info`.
+
+    At this point the flushed objects have their IDs, but `session.new`, `session.dirty` and `session.deleted` still
+    describe what was flushed. The documents themselves are rewritten by `_rewrite_stale_documents`.
+    """
+    for instance in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(instance, Author):
+            session.info.setdefault(_STALE_AUTHOR_IDS, set()).add(instance.id)
+        elif isinstance(instance, Quote):
+            session.info.setdefault(_STALE_QUOTE_IDS, set()).add(instance.id)
+        elif isinstance(instance, SingleQuote):
+            session.info.setdefault(_STALE_SINGLE_QUOTE_IDS, set()).add(instance.id)
+        elif isinstance(instance, QuoteLink):
+            session.info.setdefault(_STALE_QUOTE_IDS, set()).add(instance.quote_id)
+
+
+@event.listens_for(Session, "after_flush_postexec")
+def _rewrite_stale_documents(session: Session, flush_context: UOWTransaction) -> None:  # noqa: ARG001
+    """Rewrites (or deletes) the documents recorded as stale by `_collect_stale_documents`.
+
+    Any `Quote` containing a changed `SingleQuote`, or a `SingleQuote` said by a changed `Author`, is rewritten too. The
+    rewritten documents are flushed along with the rest of the transaction when it's committed.
+    """
+    author_ids: set[int] = session.info.pop(_STALE_AUTHOR_IDS, set())
+    quote_ids: set[int] = session.info.pop(_STALE_QUOTE_IDS, set())
+    single_quote_ids: set[int] = session.info.pop(_STALE_SINGLE_QUOTE_IDS, set())
+
+    if author_ids or single_quote_ids:
+        linked_quote_ids = (
+            select(QuoteLink.quote_id)
+            .join(SingleQuote, col(SingleQuote.id) == col(QuoteLink.single_quote_id))
+            .where(col(SingleQuote.id).in_(single_quote_ids) | col(SingleQuote.author_id).in_(author_ids))
+        )
+        quote_ids.update(session.exec(linked_quote_ids).all())
+
+    for author_id in author_ids:
+        if author := session.get(Author, author_id):
+            write_author_document(author, session)
+        elif author_document := session.get(AuthorDocument, author_id):
+            session.delete(author_document)
+
+    for quote_id in quote_ids:
+        if quote := session.get(Quote, quote_id):
+            # the links may have been written directly, or the single quotes' authors changed, since these were loaded
+            session.expire(quote, ["single_quotes"])
+            for single_quote in quote.single_quotes:
+                session.expire(single_quote, ["author"])
+            write_quote_document(quote, session)
+        elif quote_document := session.get(QuoteDocument, quote_id):
+            session.delete(quote_document)
+
+
+def get_author_document(author_id: int, session: Session) -> str | None:
+    """Gets the pre-serialized document of the `Author` with the given ID, or `None` if there's no such `Author`.
+
+    If the `Author` exists but has no document yet (e.g., it predates the documents and hasn't been backfilled), it's
+    serialized from the `Author` instead. It isn't written here, so that concurrent reads can't conflict.
+    """
+    if author_document := session.get(AuthorDocument, author_id):
+        return author_document.document
+    if author := session.get(Author, author_id):
+        return author_public(author).model_dump_json()
+    return None
+
+
+def get_quote_document(quote_id: int, session: Session) -> str | None:
+    """Gets the pre-serialized document of the `Quote` with the given ID, or `None` if there's no such `Quote`.
+
+    If the `Quote` exists but has no document yet (e.g., it predates the documents and hasn't been backfilled), it's
+    serialized from the `Quote` instead. It isn't written here, so that concurrent reads can't conflict.
+    """
+    if quote_document := session.get(QuoteDocument, quote_id):
+        return quote_document.document
+    if quote := session.get(Quote, quote_id):
+        return quote_public(quote).model_dump_json()
+    return None
+
+
+def backfill_documents(session: Session) -> int:
+    """Writes the documents for every `Author` and `Quote` that doesn't have one yet, e.g. those that predate them.
+
+    If another worker is backfilling at the same time and commits first, its documents are kept and nothing is
+    written here.
+
+    Returns:
+        The number of documents that were written.
+    """
+    authors = session.exec(select(Author).where(col(Author.id).not_in(select(AuthorDocument.author_id)))).all()
+    quotes = session.exec(select(Quote).where(col(Quote.id).not_in(select(QuoteDocument.quote_id)))).all()
+    for author in authors:
+        write_author_document(author, session)
+    for quote in quotes:
+        write_quote_document(quote, session)
+    try:
+        session.commit()
+    except IntegrityError:
+        session.rollback()
+        return 0
+    return len(authors) + len(quotes)
+
+
 # TODO: configure how we actually connect to the database... likely Postgres, right?
 SQLITE_FILE_NAME = "database.db"
 SQLITE_URL = f"sqlite:///{SQLITE_FILE_NAME}"
@@ -105,6 +297,50 @@ def create_db_and_tables() -> None:
     SQLModel.metadata.create_all(ENGINE)
 
 
+class DatabaseRevisionError(Exception):
+    """Raised if the database isn't at the latest alembic revision when the app starts up."""
+
+    def __init__(self, current_revisions: set[str], head_revisions: set[str]) -> None:  # noqa: D107
+        super().__init__(
+            f"The database is at alembic revision(s) {sorted(current_revisions) or 'none'}, "
+            f"but the latest is {sorted(head_revisions) or 'none'}. Run `alembic upgrade head` first.",
+        )
+
+
+def get_alembic_config() -> "Config":
+    """Returns the alembic `Config` for this project, as configured in its `alembic.ini` and `pyproject.toml`."""
+    # alembic is only needed by the `check_revision` startup mode, so it's imported here rather than on every startup
+    from alembic.config import Config  # noqa: PLC0415
+
+    return Config(PROJECT_DIR / "alembic.ini", toml_file=PROJECT_DIR / "pyproject.toml")
+
+
+def check_db_revision() -> set[str]:
+    """Checks that the database is at the latest alembic revision, rather than creating the tables.
+
+    This is much cheaper than `create_db_and_tables` on startup, as it's a single query instead of inspecting every
+    table, and is the right check when the schema is managed by alembic.
+
+    Raises:
+        DatabaseRevisionError: If there are no alembic revisions, if the database hasn't been migrated at all, or if
+            the database's revision(s) don't match the latest alembic revision(s).
+
+    Returns:
+        The alembic revision(s) that the database is at.
+    """
+    from alembic.runtime.migration import MigrationContext  # noqa: PLC0415
+    from alembic.script import ScriptDirectory  # noqa: PLC0415
+
+    head_revisions = set(ScriptDirectory.from_config(get_alembic_config()).get_heads())
+    with ENGINE.connect() as connection:
+        current_revisions = set(MigrationContext.configure(connection).get_current_heads())
+
+    # an empty set on either side means there's nothing to check against, which must never pass as "up to date"
+    if not head_revisions or not current_revisions or current_revisions != head_revisions:
+        raise DatabaseRevisionError(current_revisions, head_revisions)
+    return current_revisions
+
+
 def get_session() -> Generator[Session]:
     """Yield a temporary session from the database engine, useful for making database changes within the API.
 
@@ -1,36 +1,150 @@
 """The main processing entrypoint for the API. This module will start the API and handle immediate startup tasks."""
 
 import logging
-from collections.abc import AsyncGenerator
-from contextlib import asynccontextmanager
+import time
+from collections.abc import AsyncGenerator, Generator
+from contextlib import asynccontextmanager, contextmanager
+from uuid import uuid4
 
-from fastapi import FastAPI
+from fastapi import FastAPI, HTTPException
 from fastapi.exceptions import RequestValidationError
 from fastapi.responses import JSONResponse
+from sqlmodel import Session
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
+from app import IMPORTED_AT
 from app.api.v1 import author_router, quote_router
-from app.core.logging import setup_logging
-from app.core.settings import settings
-from app.database import create_db_and_tables
+from app.api.v1.quote import get_random_quote
+from app.core.logging import ACCESS_LOGGER_NAME, request_id_var, setup_logging, shutdown_logging
+from app.core.settings import SchemaStartupMode, settings
+from app.database import ENGINE, backfill_documents, check_db_revision, create_db_and_tables
+from app.templating import environment, precompile_templates, setup_bytecode_cache
 from app.urls import views_router
 
 setup_logging()
 
 logger = logging.getLogger(__name__)
+access_logger = logging.getLogger(ACCESS_LOGGER_NAME)
 
 API_PREFIX = "/api/v1"
+REQUEST_ID_HEADER = "X-Request-ID"
+
+
+@contextmanager
+def timed(step: str, timings: dict[str, float]) -> Generator[None]:
+    """Records how long the wrapped block took to run, in milliseconds, as `timings[step]`."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings[step] = (time.perf_counter() - start) * 1000
+
+
+def warm_caches() -> None:
+    """Opens a database connection and renders the random quote fragment once, as it's the hottest path in the app.
+
+    This way, the first request doesn't pay for connecting to the database or for the template's first render. It's a
+    single query and render, so it doesn't grow with the size of the database.
+    """
+    with Session(ENGINE) as session:
+        try:
+            quote = get_random_quote(session)
+        except HTTPException:  # there are no quotes yet, so there's nothing to render
+            return
+
+    author = quote["single_quotes"][-1]["author"] if quote["single_quotes"] else None
+    environment.get_template("partials/quote_fragment.html").render(quote=quote, author=author)
+
+
+def log_startup_timings(timings: dict[str, float]) -> None:
+    """Logs the breakdown of the startup timings, and warns if they exceed `settings.startup_target_ms`."""
+    total_ms = sum(timings.values())
+    breakdown = ", ".join(f"{step}={elapsed_ms:.1f}ms" for step, elapsed_ms in timings.items())
+    logger.info("Startup completed in %.1fms (%s).", total_ms, breakdown)
+    if settings.startup_target_ms is not None and total_ms > settings.startup_target_ms:
+        logger.warning("Startup took %.1fms, over the target of %.1fms.", total_ms, settings.startup_target_ms)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None]:  # noqa: ARG001
-    """Creates the database on application startup, then yields to the main application lifecycle."""
-    # Load the ML model
-    create_db_and_tables()
+    """Prepares the database, templates and caches on application startup, then yields to the main lifecycle.
+
+    Each startup step is timed, and the breakdown is logged before the app reports ready.
+    On shutdown, the logging queue is flushed so that no records are lost.
+    """
+    timings = {"imports": (time.perf_counter() - IMPORTED_AT) * 1000}
+    with timed("logging", timings):
+        setup_logging()
+    with timed("schema", timings):
+        if settings.schema_startup_mode == SchemaStartupMode.CHECK_REVISION:
+            check_db_revision()
+        else:
+            create_db_and_tables()
+    with timed("backfill", timings), Session(ENGINE) as session:
+        if document_count := backfill_documents(session):
+            logger.info("Backfilled %d missing author and quote documents.", document_count)
+    with timed("templates", timings):
+        setup_bytecode_cache()
+        precompile_templates()
+    with timed("warm_caches", timings):
+        warm_caches()
+    log_startup_timings(timings)
+
+    try:
+        yield
+    finally:
+        shutdown_logging()
+
+
+class RequestLoggingMiddleware:
+    """Tags each request with an ID for every log record it emits, then writes a (sampled) access log with its latency.
+
+    The ID is taken from the `X-Request-ID` header if the client sent one, and is echoed back in the response.
+    The access log is written even if the request raises, with a status of 500.
+
+    This is a plain ASGI middleware rather than a `BaseHTTPMiddleware`, so it doesn't add a task or a streaming hop to
+    every request.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:  # noqa: D107
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:  # noqa: D102
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = Headers(scope=scope).get(REQUEST_ID_HEADER) or uuid4().hex
+        # if the app raises before responding, the exception becomes a 500 response further up the middleware stack
+        status_code = 500
+
+        async def send_with_request_id(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                MutableHeaders(scope=message)[REQUEST_ID_HEADER] = request_id
+            await send(message)
 
-    yield
+        token = request_id_var.set(request_id)
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_request_id)
+        finally:
+            latency_ms = round((time.perf_counter() - start) * 1000, 3)
+            access_logger.info(
+                '"%s %s" %d %.3fms',
+                scope["method"],
+                scope["path"],
+                status_code,
+                latency_ms,
+                extra={"latency_ms": latency_ms},
+            )
+            request_id_var.reset(token)
 
 
 app = FastAPI(title=settings.app_name, lifespan=lifespan)
+app.add_middleware(RequestLoggingMiddleware)
 app.include_router(author_router, prefix=API_PREFIX)
 app.include_router(quote_router, prefix=API_PREFIX)
 app.include_router(views_router)
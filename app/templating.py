@@ -0,0 +1,40 @@
+"""Defines the single Jinja template environment shared by every view in the website.
+
+On startup, `setup_bytecode_cache` attaches a persistent bytecode cache to the environment, so that a restarted app
+doesn't have to recompile the templates, and `precompile_templates` loads them so that no request pays to compile them.
+"""
+
+from fastapi.templating import Jinja2Templates
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, select_autoescape
+
+from app import TEMPLATES_DIR
+from app.core.settings import settings
+
+environment = Environment(loader=FileSystemLoader(TEMPLATES_DIR), autoescape=select_autoescape())
+
+templates = Jinja2Templates(env=environment)
+
+
+def setup_bytecode_cache() -> FileSystemBytecodeCache:
+    """Attaches a persistent bytecode cache to the environment, and returns it.
+
+    The cache is stored at `settings.template_cache_dir`, which is created (readable only by the current user) if it
+    doesn't exist. If that isn't set, Jinja's default is used instead: a per-user directory in the system's temporary
+    directory, which Jinja checks is owned by the current user and not accessible by anyone else.
+    """
+    if settings.template_cache_dir is None:
+        bytecode_cache = FileSystemBytecodeCache()
+    else:
+        settings.template_cache_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+        bytecode_cache = FileSystemBytecodeCache(settings.template_cache_dir)
+
+    environment.bytecode_cache = bytecode_cache
+    return bytecode_cache
+
+
+def precompile_templates() -> list[str]:
+    """Loads every template into the environment's cache, and returns the names of the templates loaded."""
+    template_names = environment.list_templates()
+    for template_name in template_names:
+        environment.get_template(template_name)
+    return template_names
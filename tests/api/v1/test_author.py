@@ -1,6 +1,11 @@
 """Tests the `/api/v1/author` endpoints."""
 
+import json
+
 from fastapi.testclient import TestClient
+from sqlmodel import Session, delete
+
+from app.database import Author, AuthorDocument
 
 
 def test_create_and_get_author(client: TestClient) -> None:
@@ -25,3 +30,38 @@ def test_create_and_get_author(client: TestClient) -> None:
     assert fetched_author["first_name"] == first_name
     assert fetched_author["last_name"] == last_name
     assert fetched_author["name"] == name
+
+
+def test_create_author_writes_document(client: TestClient, session: Session) -> None:
+    """Tests that creating an `Author` commits its `AuthorDocument` in the same transaction."""
+    response = client.put("/api/v1/author", json={"raw_name": "Leroy_Jenkins"})
+    assert response.status_code == 200
+    created_author = response.json()
+
+    # anything left uncommitted by the endpoint is discarded here
+    session.rollback()
+    author_document = session.get(AuthorDocument, created_author["id"])
+    assert author_document is not None
+    assert json.loads(author_document.document) == created_author
+
+
+def test_get_author_without_document(client: TestClient, session: Session) -> None:
+    """Tests that an `Author` which predates the documents is still served, without writing its document on the read."""
+    author = Author(raw_name="Leroy_Jenkins")
+    session.add(author)
+    session.commit()
+    # the document is written along with the row, so it's removed to mimic a row which predates it
+    session.exec(delete(AuthorDocument))
+    session.commit()
+    assert session.get(AuthorDocument, author.id) is None
+
+    response = client.get(f"/api/v1/author/{author.id}")
+    assert response.status_code == 200
+    assert response.json()["name"] == "Leroy Jenkins"
+    assert session.get(AuthorDocument, author.id) is None
+
+
+def test_get_missing_author(client: TestClient) -> None:
+    """Tests that fetching an `Author` that doesn't exist returns a 404."""
+    response = client.get("/api/v1/author/1")
+    assert response.status_code == 404
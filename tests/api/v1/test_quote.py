@@ -1,8 +1,21 @@
 """Tests the `/api/v1/quote` endpoints."""
 
+import json
+
+import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import Session, delete
 
-from app.database import Author
+from app.database import (
+    Author,
+    AuthorDocument,
+    Quote,
+    QuoteDocument,
+    QuoteLink,
+    SingleQuote,
+    backfill_documents,
+)
 
 
 def create_author(client: TestClient) -> Author:
@@ -31,3 +44,200 @@ def create_author(client: TestClient) -> Author:
 #     assert fetched_quote["id"] == created_quote["id"]
 #     assert fetched_quote["quote"] == quote_string
 #     assert fetched_quote["author_id"] == author.id
+
+
+def test_get_quote_document(client: TestClient, session: Session) -> None:
+    """Tests that a `Quote` is served from its pre-serialized document, resolved with its single quotes and authors."""
+    author = create_author(client)
+    quote = Quote(
+        before_context="Before.",
+        after_context="After.",
+        single_quotes=[SingleQuote(text="Test quote.", author_id=author.id)],
+    )
+    session.add(quote)
+    session.commit()
+
+    response = client.get(f"/api/v1/quote/{quote.id}")
+    assert response.status_code == 200
+    fetched_quote = response.json()
+    assert fetched_quote["id"] == quote.id
+    assert fetched_quote["before_context"] == "Before."
+    assert fetched_quote["after_context"] == "After."
+    [single_quote] = fetched_quote["single_quotes"]
+    assert single_quote["text"] == "Test quote."
+    assert single_quote["author"]["id"] == author.id
+    assert single_quote["author"]["name"] == "Leroy Jenkins"
+
+    fragment_response = client.get("/api/v1/quote/random")
+    assert fragment_response.status_code == 200
+    assert "Leroy Jenkins" in fragment_response.text
+    assert "Test quote." in fragment_response.text
+
+
+def test_get_missing_quote(client: TestClient) -> None:
+    """Tests that fetching a `Quote` that doesn't exist returns a 404."""
+    response = client.get("/api/v1/quote/1")
+    assert response.status_code == 404
+
+
+def test_create_quote_writes_document(client: TestClient, session: Session) -> None:
+    """Tests that creating a `Quote` commits its `QuoteDocument` in the same transaction."""
+    response = client.put("/api/v1/quote", json={"before_context": "Before.", "after_context": "After."})
+    assert response.status_code == 200
+    created_quote = response.json()
+
+    # anything left uncommitted by the endpoint is discarded here
+    session.rollback()
+    quote_document = session.get(QuoteDocument, created_quote["id"])
+    assert quote_document is not None
+    assert json.loads(quote_document.document) == {**created_quote, "single_quotes": []}
+
+
+def seed_quote_without_document(session: Session) -> Quote:
+    """Adds an `Author` and a `Quote` to the database directly, as they were before the documents existed."""
+    author = Author(raw_name="Leroy_Jenkins")
+    quote = Quote(before_context="Before.", after_context="After.")
+    quote.single_quotes = [SingleQuote(text="Test quote.", author=author)]
+    session.add(quote)
+    session.commit()
+    # the documents are written along with the rows, so they're removed to mimic rows which predate them
+    session.exec(delete(QuoteDocument))
+    session.exec(delete(AuthorDocument))
+    session.commit()
+    assert session.get(QuoteDocument, quote.id) is None
+    return quote
+
+
+def test_get_quote_without_document(client: TestClient, session: Session) -> None:
+    """Tests that a `Quote` which predates the documents is still served, without writing its document on the read."""
+    quote = seed_quote_without_document(session)
+
+    response = client.get(f"/api/v1/quote/{quote.id}")
+    assert response.status_code == 200
+    assert response.json()["single_quotes"][0]["author"]["name"] == "Leroy Jenkins"
+    assert session.get(QuoteDocument, quote.id) is None
+
+
+def test_random_quote_without_document(client: TestClient, session: Session) -> None:
+    """Tests that the random quote views still work when no `Quote` has a document yet."""
+    seed_quote_without_document(session)
+
+    fragment_response = client.get("/api/v1/quote/random")
+    assert fragment_response.status_code == 200
+    assert "Test quote." in fragment_response.text
+
+
+def test_index_without_document(client: TestClient, session: Session) -> None:
+    """Tests that the index still works when no `Quote` has a document yet."""
+    seed_quote_without_document(session)
+
+    index_response = client.get("/")
+    assert index_response.status_code == 200
+    assert "Test quote." in index_response.text
+
+
+def test_backfill_documents(client: TestClient, session: Session) -> None:
+    """Tests that `backfill_documents` writes a document for every `Author` and `Quote` without one, only once."""
+    quote = seed_quote_without_document(session)
+    author_id = quote.single_quotes[0].author_id
+
+    assert backfill_documents(session) == 2
+    assert backfill_documents(session) == 0
+    assert session.get(AuthorDocument, author_id) is not None
+
+    quote_document = session.get(QuoteDocument, quote.id)
+    assert quote_document is not None
+    assert json.loads(quote_document.document) == client.get(f"/api/v1/quote/{quote.id}").json()
+
+
+def test_backfill_documents_conflict(session: Session, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Tests that `backfill_documents` leaves the documents alone if another worker committed them first."""
+    seed_quote_without_document(session)
+
+    def commit_conflict() -> None:
+        raise IntegrityError("INSERT INTO quotedocument ...", {}, Exception("UNIQUE constraint failed"))
+
+    with monkeypatch.context() as patch:
+        patch.setattr(session, "commit", commit_conflict)
+        assert backfill_documents(session) == 0
+    assert session.get(QuoteDocument, 1) is None
+
+
+def create_quote_without_single_quotes(client: TestClient) -> int:
+    """Creates a `Quote` through the API, which can't include its single quotes, and returns its ID."""
+    response = client.put("/api/v1/quote", json={"before_context": "Before.", "after_context": "After."})
+    response.raise_for_status()
+    return response.json()["id"]
+
+
+def assert_quote_served_with(client: TestClient, quote_id: int, text: str, author_name: str) -> None:
+    """Asserts that the `Quote`'s document and the random quote fragment both include the single quote."""
+    [single_quote] = client.get(f"/api/v1/quote/{quote_id}").json()["single_quotes"]
+    assert single_quote["text"] == text
+    assert single_quote["author"]["name"] == author_name
+
+    fragment_response = client.get("/api/v1/quote/random")
+    assert fragment_response.status_code == 200
+    assert text in fragment_response.text
+    assert author_name in fragment_response.text
+
+
+def test_random_quote_without_single_quotes(client: TestClient) -> None:
+    """Tests that the random quote fragment is served for a `Quote` that has no single quotes yet."""
+    create_quote_without_single_quotes(client)
+
+    fragment_response = client.get("/api/v1/quote/random")
+    assert fragment_response.status_code == 200
+    assert "Before." in fragment_response.text
+
+
+def test_document_rewritten_on_single_quote_added(client: TestClient, session: Session) -> None:
+    """Tests that linking a `SingleQuote` to an existing `Quote` rewrites the `Quote`'s document."""
+    author = create_author(client)
+    quote_id = create_quote_without_single_quotes(client)
+    assert client.get(f"/api/v1/quote/{quote_id}").json()["single_quotes"] == []
+
+    quote = session.get(Quote, quote_id)
+    quote.single_quotes.append(SingleQuote(text="Test quote.", author_id=author.id))
+    session.commit()
+
+    assert_quote_served_with(client, quote_id, "Test quote.", "Leroy Jenkins")
+
+
+def test_document_rewritten_on_quote_link_added(client: TestClient, session: Session) -> None:
+    """Tests that writing a `QuoteLink` row directly rewrites the linked `Quote`'s document."""
+    author = create_author(client)
+    quote_id = create_quote_without_single_quotes(client)
+    assert client.get(f"/api/v1/quote/{quote_id}").json()["single_quotes"] == []
+
+    single_quote = SingleQuote(text="Test quote.", author_id=author.id)
+    session.add(single_quote)
+    session.flush()
+    session.add(QuoteLink(single_quote_id=single_quote.id, quote_id=quote_id))
+    session.commit()
+
+    assert_quote_served_with(client, quote_id, "Test quote.", "Leroy Jenkins")
+
+
+def test_documents_rewritten_on_author_renamed(client: TestClient, session: Session) -> None:
+    """Tests that renaming an `Author` rewrites its document, and the documents of the quotes they said."""
+    author = create_author(client)
+    quote = Quote(single_quotes=[SingleQuote(text="Test quote.", author_id=author.id)])
+    session.add(quote)
+    session.commit()
+
+    stored_author = session.get(Author, author.id)
+    stored_author.raw_name = "Jane_Doe"
+    session.commit()
+
+    assert client.get(f"/api/v1/author/{author.id}").json()["name"] == "Jane Doe"
+    assert_quote_served_with(client, quote.id, "Test quote.", "Jane Doe")
+
+
+def test_quote_response_schema(client: TestClient) -> None:
+    """Tests that the OpenAPI schema of `GET /quote/{quote_id}` describes the resolved document."""
+    schema = client.get("/openapi.json").json()
+    response_schema = schema["paths"]["/api/v1/quote/{quote_id}"]["get"]["responses"]["200"]["content"]
+    assert response_schema["application/json"]["schema"]["$ref"] == "#/components/schemas/QuotePublic"
+    single_quote_schema = schema["components"]["schemas"]["SingleQuotePublic"]
+    assert single_quote_schema["properties"]["author"]["$ref"] == "#/components/schemas/AuthorPublic"
@@ -0,0 +1 @@
+"""Contains testing for the core configuration of the application."""
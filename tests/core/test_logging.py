@@ -0,0 +1,145 @@
+"""Tests the logging configuration in `app.core.logging`."""
+
+import json
+import logging
+from queue import SimpleQueue
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.core.logging import (
+    ACCESS_LOGGER_NAME,
+    LOG_FORMAT,
+    JsonFormatter,
+    RequestIdFilter,
+    SamplingFilter,
+    StructuredQueueHandler,
+    request_id_var,
+)
+from app.main import RequestLoggingMiddleware
+
+
+def make_record(**extra) -> logging.LogRecord:
+    """Creates a standard `LogRecord`, with any keyword arguments set as extra attributes."""
+    record = logging.LogRecord("test", logging.INFO, __file__, 1, "Hello, %s!", ("world",), None)
+    record.__dict__.update(extra)
+    return record
+
+
+def test_json_formatter() -> None:
+    """Tests that the `JsonFormatter` includes the message, request ID and latency."""
+    latency_ms = 1.5
+    document = json.loads(JsonFormatter().format(make_record(request_id="abc", latency_ms=latency_ms)))
+    assert document["message"] == "Hello, world!"
+    assert document["level"] == "INFO"
+    assert document["logger"] == "test"
+    assert document["request_id"] == "abc"
+    assert document["latency_ms"] == latency_ms
+
+
+def test_request_id_filter() -> None:
+    """Tests that the `RequestIdFilter` attaches the current request ID to each record."""
+    token = request_id_var.set("abc")
+    try:
+        record = make_record()
+        assert RequestIdFilter().filter(record)
+        assert record.request_id == "abc"
+    finally:
+        request_id_var.reset(token)
+
+
+def test_sampling_filter() -> None:
+    """Tests that the `SamplingFilter` keeps every record at a rate of 1, and none at a rate of 0."""
+    record = make_record()
+    assert all(SamplingFilter(1.0).filter(record) for _ in range(100))
+    assert not any(SamplingFilter(0.0).filter(record) for _ in range(100))
+
+
+def test_request_id_header(client: TestClient) -> None:
+    """Tests that the request ID is echoed back to the client, or generated if none was sent."""
+    response = client.get("/api/v1/author/1", headers={"X-Request-ID": "abc"})
+    assert response.headers["X-Request-ID"] == "abc"
+    assert client.get("/api/v1/author/1").headers["X-Request-ID"]
+
+
+def test_queue_handler_keeps_exception() -> None:
+    """Tests that an exception logged through the `StructuredQueueHandler` keeps its own field in the JSON output."""
+    log_queue = SimpleQueue()
+    logger = logging.getLogger("test.structured")
+    logger.propagate = False
+    handler = StructuredQueueHandler(log_queue)
+    logger.addHandler(handler)
+    try:
+        try:
+            raise ValueError("Oh no!")
+        except ValueError:
+            logger.exception("Hello, %s!", "world")
+    finally:
+        logger.removeHandler(handler)
+
+    record = log_queue.get_nowait()
+    assert record.exc_info is None
+    document = json.loads(JsonFormatter().format(record))
+    assert document["message"] == "Hello, world!"
+    assert "ValueError: Oh no!" in document["exc_info"]
+
+    message, traceback = logging.Formatter(LOG_FORMAT).format(record).split("\n", 1)
+    assert message.endswith("Hello, world!")
+    assert "ValueError: Oh no!" in traceback
+
+
+@pytest.fixture(name="access_sample_rate")
+def access_sample_rate_fixture(monkeypatch: pytest.MonkeyPatch) -> SamplingFilter:
+    """Yields the `SamplingFilter` on the access logger, whose `rate` can be changed for the duration of a test."""
+    [sampling_filter] = [
+        log_filter
+        for log_filter in logging.getLogger(ACCESS_LOGGER_NAME).filters
+        if isinstance(log_filter, SamplingFilter)
+    ]
+    monkeypatch.setattr(sampling_filter, "rate", sampling_filter.rate)
+    return sampling_filter
+
+
+def test_access_log(client: TestClient, caplog: pytest.LogCaptureFixture, access_sample_rate: SamplingFilter) -> None:
+    """Tests that each request is written to the access log with its status, latency and request ID."""
+    access_sample_rate.rate = 1.0
+    with caplog.at_level(logging.INFO, logger=ACCESS_LOGGER_NAME):
+        client.get("/api/v1/author/1", headers={"X-Request-ID": "abc"})
+
+    [record] = [record for record in caplog.records if record.name == ACCESS_LOGGER_NAME]
+    assert record.getMessage().startswith('"GET /api/v1/author/1" 404 ')
+    assert record.latency_ms >= 0
+    assert record.request_id == "abc"
+
+
+def test_access_log_sampling(
+    client: TestClient,
+    caplog: pytest.LogCaptureFixture,
+    access_sample_rate: SamplingFilter,
+) -> None:
+    """Tests that the access log's sample rate is applied to requests."""
+    access_sample_rate.rate = 0.0
+    with caplog.at_level(logging.INFO, logger=ACCESS_LOGGER_NAME):
+        client.get("/api/v1/author/1")
+
+    assert not [record for record in caplog.records if record.name == ACCESS_LOGGER_NAME]
+
+
+def test_access_log_on_exception(caplog: pytest.LogCaptureFixture, access_sample_rate: SamplingFilter) -> None:
+    """Tests that a request which raises is still written to the access log, as a 500."""
+    access_sample_rate.rate = 1.0
+    failing_app = FastAPI()
+    failing_app.add_middleware(RequestLoggingMiddleware)
+
+    @failing_app.get("/fail")
+    def fail() -> None:
+        raise RuntimeError
+
+    with caplog.at_level(logging.INFO, logger=ACCESS_LOGGER_NAME):
+        response = TestClient(failing_app, raise_server_exceptions=False).get("/fail")
+    assert response.is_server_error
+
+    [record] = [record for record in caplog.records if record.name == ACCESS_LOGGER_NAME]
+    assert record.getMessage().startswith('"GET /fail" 500 ')
+    assert record.latency_ms >= 0
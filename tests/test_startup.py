@@ -0,0 +1,85 @@
+"""Tests the startup tasks that run in the app's `lifespan`."""
+
+import stat
+from pathlib import Path
+
+import pytest
+from alembic import command
+from alembic.config import Config
+from jinja2 import FileSystemBytecodeCache
+from sqlmodel import SQLModel, create_engine
+
+from app import database, templating
+from app.core.settings import settings
+from app.database import PROJECT_DIR, DatabaseRevisionError, check_db_revision
+from app.templating import precompile_templates, setup_bytecode_cache
+
+HEAD_REVISION = "9b1f3e6a7c2d"
+
+
+def test_precompile_templates() -> None:
+    """Tests that every template is compiled into the shared environment."""
+    assert set(precompile_templates()) == {"index.html", "partials/quote_fragment.html"}
+
+
+def test_setup_bytecode_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Tests that a configured bytecode cache directory is created, readable only by the current user."""
+    cache_dir = tmp_path / "jinja"
+    monkeypatch.setattr(settings, "template_cache_dir", cache_dir)
+    monkeypatch.setattr(templating.environment, "bytecode_cache", None)
+
+    bytecode_cache = setup_bytecode_cache()
+    assert templating.environment.bytecode_cache is bytecode_cache
+    assert Path(bytecode_cache.directory) == cache_dir
+    assert stat.S_IMODE(cache_dir.stat().st_mode) == stat.S_IRWXU
+
+
+def test_setup_default_bytecode_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Tests that Jinja's per-user default bytecode cache is used if no directory is configured."""
+    monkeypatch.setattr(settings, "template_cache_dir", None)
+    monkeypatch.setattr(templating.environment, "bytecode_cache", None)
+
+    bytecode_cache = setup_bytecode_cache()
+    assert bytecode_cache.directory == FileSystemBytecodeCache().directory
+
+
+@pytest.fixture(name="alembic_config")
+def alembic_config_fixture(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Config:
+    """Points the app and alembic at an empty, temporary database, and returns the alembic `Config` for it.
+
+    The `Config` is read from `pyproject.toml` alone, so that alembic doesn't reconfigure logging from `alembic.ini`.
+    """
+    database_url = f"sqlite:///{tmp_path / 'database.db'}"
+    monkeypatch.setattr(database, "ENGINE", create_engine(database_url))
+    config = Config(toml_file=PROJECT_DIR / "pyproject.toml")
+    config.set_main_option("sqlalchemy.url", database_url)
+    return config
+
+
+def test_check_db_revision(alembic_config: Config) -> None:
+    """Tests that the revision check only passes when the database is at the latest revision."""
+    command.upgrade(alembic_config, "head")
+    assert check_db_revision() == {HEAD_REVISION}
+
+    command.downgrade(alembic_config, "-1")
+    with pytest.raises(DatabaseRevisionError):
+        check_db_revision()
+
+
+def test_check_db_revision_empty_database(alembic_config: Config) -> None:  # noqa: ARG001
+    """Tests that the revision check fails for a database that has never been migrated."""
+    with pytest.raises(DatabaseRevisionError):
+        check_db_revision()
+
+
+def test_check_db_revision_created_tables(alembic_config: Config) -> None:  # noqa: ARG001
+    """Tests that the revision check fails for a database whose tables were created without alembic."""
+    SQLModel.metadata.create_all(database.ENGINE)
+    with pytest.raises(DatabaseRevisionError):
+        check_db_revision()
+
+
+def test_migrations_match_models(alembic_config: Config) -> None:
+    """Tests that the alembic migrations create exactly the tables defined by the models."""
+    command.upgrade(alembic_config, "head")
+    command.check(alembic_config)